@@ -0,0 +1,34 @@
+"""Numba compiled helpers for very large bar charts.
+
+This module requires Numba and NumPy, and is only imported by :mod:`rich.bar_chart`
+when the ``RICH_BAR_CHART_JIT`` environment variable is set.
+"""
+
+from typing import List, Sequence
+
+import numba
+import numpy
+
+
+@numba.njit(cache=True)
+def _scale(values, max_value, size):  # type: ignore[no-untyped-def]
+    lengths = numpy.empty(values.shape[0], dtype=numpy.int64)
+    for index in range(values.shape[0]):
+        lengths[index] = int((values[index] / max_value) * size)
+    return lengths
+
+
+def scale_values(values: Sequence[float], max_value: float, size: int) -> List[int]:
+    """Scale values to integer lengths, where ``max_value`` maps to ``size``.
+
+    Args:
+        values (Sequence[float]): Values to scale.
+        max_value (float): Value which corresponds to a length of ``size``.
+        size (int): Length of the largest bar.
+
+    Returns:
+        List[int]: Length of each value.
+    """
+    value_array = numpy.asarray(values, dtype=numpy.float64)
+    lengths = _scale(value_array, float(max_value), int(size))
+    return lengths.tolist()  # type: ignore[no-any-return]
@@ -1,10 +1,15 @@
 """Bar chart renderable for Rich."""
 
+import os
+from array import array
 from collections.abc import Mapping, Sequence
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from .bar import END_BLOCK_ELEMENTS, FULL_BLOCK
-from .console import Console, ConsoleOptions, RenderResult
+from .color import Color
+from .console import Console, ConsoleOptions, RenderableType, RenderResult
 from .jupyter import JupyterMixin
 from .measure import Measurement
 from .segment import Segment
@@ -20,6 +25,102 @@ DEFAULT_COLORS = [
     "bright_blue",
     "bright_green",
 ]
+_DEFAULT_STYLES = [Style.from_color(Color.parse(color)) for color in DEFAULT_COLORS]
+
+# Minimum number of bars before bar lengths are computed with NumPy (if installed)
+_NUMPY_THRESHOLD = 64
+# Minimum number of bars before the Numba path is used (if enabled and installed)
+_JIT_THRESHOLD = 512
+
+_SPACE_SEGMENT = Segment(" ")
+_LINE_SEGMENT = Segment.line()
+
+_ScaleValues = Callable[[Sequence[float], float, int], List[int]]
+
+# label_width, bar_area_width, bar_lengths, bar_texts, label_texts, value_texts
+_HorizontalGeometry = Tuple[int, int, List[int], List[str], List[str], List[str]]
+
+
+def _build_bar_string_table(max_length: int, bar_width: int) -> List[str]:
+    """Build the bar string for every bar length from 0 to max_length.
+
+    Args:
+        max_length (int): Longest bar length to build a string for.
+        bar_width (int): Number of length units per full block.
+
+    Returns:
+        List[str]: Bar strings, indexed by bar length.
+    """
+    end_count = len(END_BLOCK_ELEMENTS)
+    table: List[str] = []
+    for length in range(max_length + 1):
+        full_blocks, remainder = divmod(length, bar_width)
+        bar_chars = FULL_BLOCK * full_blocks
+        if 0 < remainder < end_count:
+            bar_chars += END_BLOCK_ELEMENTS[remainder]
+        table.append(bar_chars)
+    return table
+
+
+def _to_number(value: float) -> float:
+    """Convert a chart value to a float, keeping integers exact."""
+    return int(value) if isinstance(value, int) else float(value)
+
+
+@lru_cache(maxsize=None)
+def _load_numpy() -> Optional[ModuleType]:
+    """Import NumPy on first use, or return None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    module: ModuleType = numpy
+    return module
+
+
+def _jit_enabled() -> bool:
+    """Check if the ``RICH_BAR_CHART_JIT`` environment variable enables Numba."""
+    flag = os.environ.get("RICH_BAR_CHART_JIT", "")
+    return flag.strip().lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def _load_jit_scale_values() -> Optional[_ScaleValues]:
+    """Import the Numba compiled scaling function on first use, or None if missing."""
+    try:
+        from ._bar_chart_fast import scale_values
+    except ImportError:
+        return None
+    return scale_values
+
+
+def _scale_values(values: Sequence[float], max_value: float, size: int) -> List[int]:
+    """Scale values to integer lengths, where ``max_value`` maps to ``size``.
+
+    Uses NumPy for large inputs when it is installed, or a Numba compiled loop for
+    very large inputs if the ``RICH_BAR_CHART_JIT`` environment variable is set.
+
+    Args:
+        values (Sequence[float]): Values to scale.
+        max_value (float): Value which corresponds to a length of ``size``.
+        size (int): Length of the largest bar.
+
+    Returns:
+        List[int]: Length of each value.
+    """
+    if max_value <= 0:
+        return [0] * len(values)
+    if len(values) > _JIT_THRESHOLD and _jit_enabled():
+        jit_scale_values = _load_jit_scale_values()
+        if jit_scale_values is not None:
+            return jit_scale_values(values, max_value, size)
+    if len(values) >= _NUMPY_THRESHOLD:
+        numpy = _load_numpy()
+        if numpy is not None:
+            value_array = numpy.asarray(values, dtype=numpy.float64)
+            lengths = ((value_array / max_value) * size).astype(numpy.int64)
+            return lengths.tolist()  # type: ignore[no-any-return]
+    return [int((value / max_value) * size) for value in values]
 
 
 class BarChart(JupyterMixin):
@@ -47,6 +148,44 @@ class BarChart(JupyterMixin):
         value_style (StyleType, optional): Style for values. Defaults to None.
     """
 
+    __slots__ = [
+        "width",
+        "show_values",
+        "bar_width",
+        "_orientation",
+        "chart_height",
+        "style",
+        "bar_styles",
+        "label_style",
+        "value_style",
+        "group_gap",
+        "group_styles",
+        "grouped",
+        "group_labels",
+        "_simple_rows",
+        "_group_rows",
+        "max_value",
+        "_explicit_group_labels",
+        "_integer_values",
+        "_labels",
+        "_values",
+        "_max_label_len",
+        "_label_paddings",
+        "_style_key",
+        "_label_style_obj",
+        "_value_style_obj",
+        "_bar_style_objs",
+        "_group_style_objs",
+        "_value_texts",
+        "_group_value_texts",
+        "_value_reserve",
+        "_geom_cache",
+        "_vertical_geom_cache",
+        "_bar_table",
+        "_vertical_rows_cache",
+        "_render_cache",
+    ]
+
     def __init__(
         self,
         data: Union["Dict[str, float]", List[Tuple[str, float]], Sequence[float]],
@@ -85,12 +224,63 @@ class BarChart(JupyterMixin):
 
         self.grouped = False
         self.group_labels: List[str] = []
-        self.simple_rows: List[Tuple[str, float]] = []
-        self.group_rows: List[Tuple[str, List[float]]] = []
+        self._simple_rows: List[Tuple[str, float]] = []
+        self._group_rows: List[Tuple[str, List[float]]] = []
+
+        self._geom_cache: Optional[Tuple[Tuple[Any, ...], _HorizontalGeometry]] = None
+        self._vertical_geom_cache: Optional[Tuple[Tuple[Any, ...], List[int]]] = None
+        self._bar_table: Optional[Tuple[Tuple[int, int], List[str]]] = None
+        self._vertical_rows_cache: Optional[
+            Tuple[Tuple[Any, ...], List[List[Segment]]]
+        ] = None
+        self._render_cache: Optional[
+            Tuple[Hashable, Tuple[Union[RenderableType, Segment], ...]]
+        ] = None
 
         self._normalize_items(items)
+        self._update_rows()
         self._set_max_value(max_value)
 
+    @property
+    def orientation(self) -> str:
+        """The orientation of the chart, either ``"horizontal"`` or ``"vertical"``."""
+        return self._orientation
+
+    @orientation.setter
+    def orientation(self, orientation: str) -> None:
+        if orientation not in ("horizontal", "vertical"):
+            raise ValueError(
+                f"orientation must be 'horizontal' or 'vertical', not {orientation!r}"
+            )
+        self._orientation = orientation
+        self._render_cache = None
+
+    @property
+    def simple_rows(self) -> List[Tuple[str, float]]:
+        """The (label, value) rows of a chart of single bars.
+
+        Assign a new list to update the chart; changes made in place are not seen.
+        """
+        return self._simple_rows
+
+    @simple_rows.setter
+    def simple_rows(self, rows: List[Tuple[str, float]]) -> None:
+        self._simple_rows = rows
+        self._update_rows()
+
+    @property
+    def group_rows(self) -> List[Tuple[str, List[float]]]:
+        """The (label, values) rows of a grouped chart, one value per group label.
+
+        Assign a new list to update the chart; changes made in place are not seen.
+        """
+        return self._group_rows
+
+    @group_rows.setter
+    def group_rows(self, rows: List[Tuple[str, List[float]]]) -> None:
+        self._group_rows = rows
+        self._update_rows()
+
     # --------------------------------------------------------------------- #
     # Initialization helpers
     # --------------------------------------------------------------------- #
@@ -106,7 +296,14 @@ class BarChart(JupyterMixin):
                 return []
             first = data[0]
             if isinstance(first, tuple) and len(first) == 2:
-                return list(data)  # type: ignore[list-item]
+                rows = list(data)
+                for row in rows:
+                    if not (isinstance(row, tuple) and len(row) == 2):
+                        raise TypeError(
+                            "BarChart data must contain only (label, value) tuples, "
+                            f"not {row!r}"
+                        )
+                return rows  # type: ignore[return-value]
             return [(index, value) for index, value in enumerate(data)]
         raise TypeError("BarChart data must be a mapping or sequence")
 
@@ -119,8 +316,8 @@ class BarChart(JupyterMixin):
             self.grouped = True
             self._normalize_grouped_items(items)  # type: ignore[arg-type]
         else:
-            self.simple_rows = [
-                (str(label), float(value)) for label, value in items  # type: ignore[arg-type]
+            self._simple_rows = [
+                (str(label), _to_number(value)) for label, value in items  # type: ignore[arg-type]
             ]
 
     def _normalize_grouped_items(
@@ -139,7 +336,7 @@ class BarChart(JupyterMixin):
             row_dict: Dict[str, float] = {}
             for key, value in mapping.items():
                 key_str = str(key)
-                row_dict[key_str] = float(value)
+                row_dict[key_str] = _to_number(value)
                 if not self._explicit_group_labels and key_str not in seen:
                     groups.append(key_str)
                     seen.add(key_str)
@@ -150,51 +347,117 @@ class BarChart(JupyterMixin):
 
         self.group_labels = groups
         for label, mapping in normalized_rows:
-            row_values = [mapping.get(group, 0.0) for group in self.group_labels]
-            self.group_rows.append((label, row_values))
+            row_values = [mapping.get(group, 0) for group in self.group_labels]
+            self._group_rows.append((label, row_values))
 
     def _set_max_value(self, max_value: Optional[float]) -> None:
-        values: List[float]
+        computed_max: float
         if self.grouped:
-            values = [
-                value
-                for _, row in self.group_rows
-                for value in row
-            ]
+            computed_max = max(
+                (value for _, row in self.group_rows for value in row), default=0.0
+            )
         else:
-            values = [value for _, value in self.simple_rows]
-
-        if not values:
-            values = [0.0]
+            computed_max = max(self._values, default=0.0)
 
-        computed_max = max(values)
         if computed_max <= 0:
             computed_max = 1.0
 
-        self.max_value = max_value if max_value is not None else computed_max
+        self.max_value = max_value if max_value is not None else float(computed_max)
         if self.max_value <= 0:
             self.max_value = 1.0
 
-    # --------------------------------------------------------------------- #
-    # Rendering helpers
-    # --------------------------------------------------------------------- #
+    def _update_rows(self) -> None:
+        """Rebuild the state derived from the rows, and clear render caches."""
+        simple_rows = self._simple_rows
+        self._labels: Tuple[str, ...] = tuple(label for label, _ in simple_rows)
+        self._values = array("d", [value for _, value in simple_rows])
+        self._max_label_len = max(map(len, self._labels), default=0)
+        self._label_paddings = [
+            Segment(" " * (self._max_label_len + 1 - len(label)))
+            for label in self._labels
+        ]
+        self._group_value_texts: List[List[str]] = []
+        if self.grouped:
+            group_values = [value for _, row in self._group_rows for value in row]
+            self._integer_values = all(isinstance(value, int) for value in group_values)
+            group_texts = self._format_values(group_values)
+            offset = 0
+            for _, row in self._group_rows:
+                self._group_value_texts.append(group_texts[offset : offset + len(row)])
+                offset += len(row)
+            self._value_texts: List[str] = []
+            self._value_reserve = max(map(len, group_texts), default=0)
+        else:
+            self._integer_values = all(
+                isinstance(value, int) for _, value in simple_rows
+            )
+            self._value_texts = self._format_values([value for _, value in simple_rows])
+            self._value_reserve = max(map(len, self._value_texts), default=0)
 
-    def _get_label_style(self) -> Optional[Style]:
-        return Style.parse(str(self.label_style)) if self.label_style else None
+        self._geom_cache = None
+        self._vertical_geom_cache = None
+        self._bar_table = None
+        self._cache_styles()
 
-    def _get_value_style(self) -> Optional[Style]:
-        return Style.parse(str(self.value_style)) if self.value_style else None
+    def _format_values(self, values: Sequence[float]) -> List[str]:
+        """Format values right aligned to a common width.
 
-    def _get_bar_style(self, index: int) -> Style:
+        Args:
+            values (Sequence[float]): Values to format.
+
+        Returns:
+            List[str]: Value texts, each with a leading space.
+        """
+        if not values:
+            return []
+        if self._integer_values:
+            field_width = max(len(str(value)) for value in values)
+            value_format = f" {{:>{field_width}d}}"
+            return [value_format.format(value) for value in values]
+        field_width = max(len(f"{value:.2f}") for value in values)
+        value_format = f" {{:>{field_width}.2f}}"
+        return [value_format.format(value) for value in values]
+
+    def _get_style_key(self) -> Tuple[Any, ...]:
+        """Get the attributes which the cached styles are built from."""
+        return (
+            self.style,
+            self.label_style,
+            self.value_style,
+            tuple(self.bar_styles or ()),
+            tuple(self.group_styles or ()),
+            len(self._simple_rows),
+            len(self.group_labels),
+        )
+
+    def _cache_styles(self) -> None:
+        """Parse all styles ahead of rendering, and clear dependent caches."""
+        self._style_key = self._get_style_key()
+        self._bar_style_objs = [
+            self._resolve_bar_style(index) for index in range(len(self._simple_rows))
+        ]
+        self._label_style_obj = (
+            Style.parse(str(self.label_style)) if self.label_style else None
+        )
+        self._value_style_obj = (
+            Style.parse(str(self.value_style)) if self.value_style else None
+        )
+        self._group_style_objs = [
+            self._resolve_group_style(index) for index in range(len(self.group_labels))
+        ]
+        self._vertical_rows_cache = None
+        self._render_cache = None
+
+    def _resolve_bar_style(self, index: int) -> Style:
         if self.bar_styles:
             raw_style = self.bar_styles[index % len(self.bar_styles)]
         elif self.style:
             raw_style = self.style
         else:
-            raw_style = DEFAULT_COLORS[index % len(DEFAULT_COLORS)]
+            return _DEFAULT_STYLES[index % len(_DEFAULT_STYLES)]
         return Style.parse(str(raw_style))
 
-    def _get_group_style(self, index: int) -> Style:
+    def _resolve_group_style(self, index: int) -> Style:
         if self.group_styles:
             raw_style = self.group_styles[index % len(self.group_styles)]
         elif self.bar_styles:
@@ -202,9 +465,25 @@ class BarChart(JupyterMixin):
         elif self.style:
             raw_style = self.style
         else:
-            raw_style = DEFAULT_COLORS[index % len(DEFAULT_COLORS)]
+            return _DEFAULT_STYLES[index % len(_DEFAULT_STYLES)]
         return Style.parse(str(raw_style))
 
+    # --------------------------------------------------------------------- #
+    # Rendering helpers
+    # --------------------------------------------------------------------- #
+
+    def _get_label_style(self) -> Optional[Style]:
+        return self._label_style_obj
+
+    def _get_value_style(self) -> Optional[Style]:
+        return self._value_style_obj
+
+    def _get_bar_style(self, index: int) -> Style:
+        return self._bar_style_objs[index]
+
+    def _get_group_style(self, index: int) -> Style:
+        return self._group_style_objs[index]
+
     def _bar_length(self, value: float, bar_area_width: int) -> int:
         if self.max_value <= 0:
             return 0
@@ -213,10 +492,32 @@ class BarChart(JupyterMixin):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        if self.orientation == "vertical":
-            yield from self._render_vertical(console, options)
+        if self._get_style_key() != self._style_key:
+            self._cache_styles()
+        # Assigning new rows clears this cache, so the key covers everything else
+        key = (
+            self._orientation,
+            self.grouped,
+            tuple(self.group_labels),
+            self.width,
+            self.max_value,
+            self.show_values,
+            self.bar_width,
+            self.chart_height,
+            self.group_gap,
+            options.max_width,
+            options.height,
+            options.size.height,
+        )
+        cache = self._render_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        if self._orientation == "vertical":
+            segments = tuple(self._render_vertical(console, options))
         else:
-            yield from self._render_horizontal(console, options)
+            segments = tuple(self._render_horizontal(console, options))
+        self._render_cache = (key, segments)
+        return segments
 
     # ------------------------------------------------------------------ #
     # Horizontal rendering
@@ -233,38 +534,73 @@ class BarChart(JupyterMixin):
             self.width if self.width is not None else options.max_width,
             options.max_width,
         )
+        (
+            _label_width,
+            _bar_area_width,
+            _bar_lengths,
+            bar_texts,
+            label_texts,
+            value_texts,
+        ) = self._get_horizontal_geometry(available_width)
+
+        label_style = self._get_label_style()
+        value_style = self._get_value_style()
+        bar_styles = self._bar_style_objs
+        newline = _LINE_SEGMENT
+
+        for label, label_text, padding, bar_text, bar_style, value_text in zip(
+            self._labels,
+            label_texts,
+            self._label_paddings,
+            bar_texts,
+            bar_styles,
+            value_texts,
+        ):
+            if label_style is None:
+                yield Segment(label_text)
+            else:
+                # Keep the padding unstyled so backgrounds only cover the label
+                yield padding
+                yield Segment(label, label_style)
+            yield _SPACE_SEGMENT
+            yield Segment(bar_text, bar_style)
+            if value_text:
+                yield Segment(value_text, value_style)
+            yield newline
 
-        max_label_len = max(len(label) for label, _ in self.simple_rows)
-        label_width = max_label_len + 2
+    def _get_horizontal_geometry(self, available_width: int) -> _HorizontalGeometry:
+        """Get label and bar sizes for a horizontal chart, cached between renders."""
+        key = (available_width, self.max_value, self.show_values, self.bar_width)
+        cache = self._geom_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
 
+        label_width = self._max_label_len + 2
         bar_area_width = available_width - label_width
         if self.show_values:
-            bar_area_width -= 12
+            bar_area_width -= self._value_reserve
         if bar_area_width < 1:
             bar_area_width = 1
 
-        label_style = self._get_label_style()
-        value_style = self._get_value_style()
-
-        for idx, (label, value) in enumerate(self.simple_rows):
-            bar_style = self._get_bar_style(idx)
-            bar_length = self._bar_length(value, bar_area_width)
-            bar_text = self._make_horizontal_bar(bar_length)
-            value_text = ""
-            if self.show_values:
-                value_text = f" {value:.2f}"
-
-            label_padding = " " * (label_width - len(label) - 1)
-            line_segments: List[Segment] = [
-                Segment(label_padding),
-                Segment(label, label_style),
-                Segment(" "),
-                Segment(bar_text, bar_style),
-            ]
-            if value_text:
-                line_segments.append(Segment(value_text, value_style))
-            line_segments.append(Segment.line())
-            yield from line_segments
+        bar_lengths = _scale_values(self._values, self.max_value, bar_area_width)
+        bar_table = self._get_bar_table(bar_area_width)
+        bar_texts = [
+            self._make_horizontal_bar(length, bar_table) for length in bar_lengths
+        ]
+        label_texts = [label.rjust(label_width - 1) for label in self._labels]
+        value_texts = (
+            self._value_texts if self.show_values else [""] * len(self._labels)
+        )
+        geometry = (
+            label_width,
+            bar_area_width,
+            bar_lengths,
+            bar_texts,
+            label_texts,
+            value_texts,
+        )
+        self._geom_cache = (key, geometry)
+        return geometry
 
     def _render_horizontal_grouped(
         self, console: Console, options: ConsoleOptions
@@ -281,41 +617,66 @@ class BarChart(JupyterMixin):
 
         bar_area_width = available_width - label_width - group_width - 2
         if self.show_values:
-            bar_area_width -= 12
+            bar_area_width -= self._value_reserve
         if bar_area_width < 1:
             bar_area_width = 1
+        bar_table = self._get_bar_table(bar_area_width)
 
         label_style = self._get_label_style()
         value_style = self._get_value_style()
+        newline = _LINE_SEGMENT
+        space = _SPACE_SEGMENT
+        show_values = self.show_values
+        group_styles = self._group_style_objs
+        group_segments = [
+            Segment(name.ljust(group_width), label_style) for name in self.group_labels
+        ]
+        blank_category_segment = Segment(" " * label_width)
 
-        for label, values in self.group_rows:
+        for (label, values), value_texts in zip(
+            self.group_rows, self._group_value_texts
+        ):
             for group_index, value in enumerate(values):
                 bar_length = self._bar_length(value, bar_area_width)
-                bar_style = self._get_group_style(group_index)
-
-                category_column = label if group_index == 0 else ""
-                category_column = category_column.ljust(label_width)
-                group_name = self.group_labels[group_index]
-                group_column = group_name.ljust(group_width)
-
-                line_segments: List[Segment] = [
-                    Segment(category_column, label_style if category_column.strip() else None),
-                    Segment(" "),
-                    Segment(group_column, label_style),
-                    Segment(" "),
-                    Segment(self._make_horizontal_bar(bar_length), bar_style),
-                ]
-                if self.show_values:
-                    line_segments.append(Segment(f" {value:.2f}", value_style))
-                line_segments.append(Segment.line())
-                yield from line_segments
+                if group_index == 0:
+                    category_column = label.ljust(label_width)
+                    yield Segment(
+                        category_column,
+                        label_style if category_column.strip() else None,
+                    )
+                else:
+                    yield blank_category_segment
+                yield space
+                yield group_segments[group_index]
+                yield space
+                yield Segment(
+                    self._make_horizontal_bar(bar_length, bar_table),
+                    group_styles[group_index],
+                )
+                if show_values:
+                    yield Segment(value_texts[group_index], value_style)
+                yield newline
 
             # Blank line between categories for readability
-            yield Segment.line()
+            yield newline
 
         yield from self._render_group_legend()
 
-    def _make_horizontal_bar(self, bar_length: int) -> str:
+    def _get_bar_table(self, bar_area_width: int) -> List[str]:
+        """Get the bar string table for the given bar area, cached between renders."""
+        key = (bar_area_width, self.bar_width)
+        cache = self._bar_table
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        bar_table = _build_bar_string_table(bar_area_width, self.bar_width)
+        self._bar_table = (key, bar_table)
+        return bar_table
+
+    def _make_horizontal_bar(
+        self, bar_length: int, bar_table: Optional[List[str]] = None
+    ) -> str:
+        if bar_table is not None and 0 <= bar_length < len(bar_table):
+            return bar_table[bar_length]
         full_blocks = bar_length // self.bar_width
         remainder = bar_length % self.bar_width
         bar_chars = FULL_BLOCK * full_blocks
@@ -336,33 +697,68 @@ class BarChart(JupyterMixin):
 
         chart_height = self._get_chart_height(options)
         label_style = self._get_label_style()
-
-        bar_heights = [
-            self._bar_length(value, chart_height) for _, value in self.simple_rows
-        ]
-        bar_styles = [self._get_bar_style(idx) for idx in range(len(bar_heights))]
+        newline = _LINE_SEGMENT
 
         gap = 1
+        for row_segments in self._get_vertical_rows(chart_height, gap):
+            yield from row_segments
+
+        labels = self._labels
+        column_width = self.bar_width + gap
+        gap_segment = Segment(" " * gap)
+        last = len(labels) - 1
+        for idx, label in enumerate(labels):
+            label_str = self._fit_label(label)
+            if label_style is None:
+                if idx != last:
+                    label_str = label_str.ljust(column_width)
+                yield Segment(label_str)
+            else:
+                # Keep the gap unstyled so adjacent labels stay separate
+                yield Segment(label_str, label_style)
+                if idx != last:
+                    yield gap_segment
+        yield newline
+
+    def _get_vertical_rows(self, chart_height: int, gap: int) -> List[List[Segment]]:
+        """Get the segments for each row of a vertical chart, cached between renders."""
+        bar_heights = self._get_bar_heights(chart_height)
+        key = (chart_height, gap, self.bar_width, tuple(bar_heights))
+        cache = self._vertical_rows_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        newline = _LINE_SEGMENT
+        gap_segment = Segment(" " * gap)
+        empty_segment = Segment(" " * self.bar_width)
+        filled_cell = FULL_BLOCK * self.bar_width
+        filled_segments = [
+            Segment(filled_cell, style) for style in self._bar_style_objs
+        ]
+        last = len(bar_heights) - 1
+        rows: List[List[Segment]] = []
         for row in range(chart_height, 0, -1):
-            segments: List[Segment] = []
+            row_segments: List[Segment] = []
             for idx, height in enumerate(bar_heights):
-                if height >= row:
-                    segments.append(Segment(FULL_BLOCK * self.bar_width, bar_styles[idx]))
-                else:
-                    segments.append(Segment(" " * self.bar_width))
-                if idx != len(bar_heights) - 1:
-                    segments.append(Segment(" " * gap))
-            segments.append(Segment.line())
-            yield from segments
-
-        label_segments: List[Segment] = []
-        for idx, (label, _value) in enumerate(self.simple_rows):
-            label_str = self._fit_label(label)
-            label_segments.append(Segment(label_str, label_style))
-            if idx != len(self.simple_rows) - 1:
-                label_segments.append(Segment(" " * gap))
-        label_segments.append(Segment.line())
-        yield from label_segments
+                row_segments.append(
+                    filled_segments[idx] if height >= row else empty_segment
+                )
+                if idx != last:
+                    row_segments.append(gap_segment)
+            row_segments.append(newline)
+            rows.append(row_segments)
+        self._vertical_rows_cache = (key, rows)
+        return rows
+
+    def _get_bar_heights(self, chart_height: int) -> List[int]:
+        """Get bar heights for a vertical chart, cached between renders."""
+        key = (chart_height, self.max_value)
+        cache = self._vertical_geom_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        bar_heights = _scale_values(self._values, self.max_value, chart_height)
+        self._vertical_geom_cache = (key, bar_heights)
+        return bar_heights
 
     def _render_vertical_grouped(
         self, console: Console, options: ConsoleOptions
@@ -370,6 +766,7 @@ class BarChart(JupyterMixin):
         chart_height = self._get_chart_height(options)
         label_style = self._get_label_style()
 
+        newline = _LINE_SEGMENT
         group_count = len(self.group_labels)
         group_gap = self.group_gap
         category_gap = group_gap + 1
@@ -380,44 +777,47 @@ class BarChart(JupyterMixin):
                 [self._bar_length(value, chart_height) for value in values]
             )
 
+        filled_cell = FULL_BLOCK * self.bar_width
+        filled_segments = [
+            Segment(filled_cell, style) for style in self._group_style_objs
+        ]
+        empty_segment = Segment(" " * self.bar_width)
+        group_gap_segment = Segment(" " * group_gap)
+        category_gap_segment = Segment(" " * category_gap)
+        last_group = group_count - 1
+        last_category = len(heights) - 1
+
         for row in range(chart_height, 0, -1):
-            segments: List[Segment] = []
             for cat_idx, category_heights in enumerate(heights):
                 for group_index, bar_height in enumerate(category_heights):
                     if bar_height >= row:
-                        style = self._get_group_style(group_index)
-                        segments.append(Segment(FULL_BLOCK * self.bar_width, style))
+                        yield filled_segments[group_index]
                     else:
-                        segments.append(Segment(" " * self.bar_width))
-                    if group_index != group_count - 1:
-                        segments.append(Segment(" " * group_gap))
-                if cat_idx != len(heights) - 1:
-                    segments.append(Segment(" " * category_gap))
-            segments.append(Segment.line())
-            yield from segments
+                        yield empty_segment
+                    if group_index != last_group:
+                        yield group_gap_segment
+                if cat_idx != last_category:
+                    yield category_gap_segment
+            yield newline
 
         category_width = group_count * self.bar_width + (group_count - 1) * group_gap
-        label_segments: List[Segment] = []
         for cat_idx, (label, _values) in enumerate(self.group_rows):
             label_text = self._center_text(label, category_width)
-            label_segments.append(Segment(label_text, label_style))
-            if cat_idx != len(self.group_rows) - 1:
-                label_segments.append(Segment(" " * category_gap))
-        label_segments.append(Segment.line())
-        yield from label_segments
+            yield Segment(label_text, label_style)
+            if cat_idx != last_category:
+                yield category_gap_segment
+        yield newline
 
         yield from self._render_group_legend()
 
     def _render_group_legend(self) -> RenderResult:
         if not self.grouped or not self.group_labels:
             return
-        segments: List[Segment] = []
-        for idx, group in enumerate(self.group_labels):
-            style = self._get_group_style(idx)
-            segments.append(Segment(FULL_BLOCK * self.bar_width, style))
-            segments.append(Segment(f" {group}  "))
-        segments.append(Segment.line())
-        yield from segments
+        block = FULL_BLOCK * self.bar_width
+        for style, group in zip(self._group_style_objs, self.group_labels):
+            yield Segment(block, style)
+            yield Segment(f" {group}  ")
+        yield _LINE_SEGMENT
 
     # ------------------------------------------------------------------ #
     # Utilities
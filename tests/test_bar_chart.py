@@ -0,0 +1,248 @@
+import copy
+import sys
+
+import pytest
+
+from rich.bar_chart import (
+    BarChart,
+    _build_bar_string_table,
+    _jit_enabled,
+    _load_jit_scale_values,
+    _load_numpy,
+    _scale_values,
+)
+from rich.console import Console
+from rich.style import Style
+
+from .render import render
+
+
+def test_render_horizontal():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    expected = "  a \x1b[34m████████████\x1b[0m 1\n bb \x1b[32m████████████████████████\x1b[0m 2\n"
+    assert render(chart) == expected
+
+
+def test_render_horizontal_float_values():
+    chart = BarChart({"a": 1.5, "bb": 12.25}, width=30)
+    expected = (
+        "  a \x1b[34m██\x1b[0m  1.50\n bb \x1b[32m████████████████████\x1b[0m 12.25\n"
+    )
+    assert render(chart) == expected
+
+
+def test_render_vertical():
+    chart = BarChart({"a": 1, "bb": 2}, orientation="vertical", chart_height=2)
+    expected = "  \x1b[32m█\x1b[0m\n\x1b[34m█\x1b[0m \x1b[32m█\x1b[0m\na b\n"
+    assert render(chart) == expected
+
+
+def test_styles_parsed_once():
+    chart = BarChart(
+        [("a", 1), ("b", 2), ("c", 3)],
+        bar_styles=["red", "green"],
+        label_style="bold",
+        value_style="dim",
+    )
+    assert chart._get_label_style() == Style(bold=True)
+    assert chart._get_value_style() == Style(dim=True)
+    assert chart._get_bar_style(0) == Style.parse("red")
+    assert chart._get_bar_style(1) == Style.parse("green")
+    assert chart._get_bar_style(2) is chart._get_bar_style(0)
+
+
+def test_default_bar_styles():
+    chart = BarChart([1, 2, 3])
+    assert chart._get_bar_style(0) == Style.parse("blue")
+    assert chart._get_bar_style(1) == Style.parse("green")
+    assert chart._get_bar_style(2) == Style.parse("yellow")
+
+
+def test_geometry_cached():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    geometry = chart._get_horizontal_geometry(30)
+    assert chart._get_horizontal_geometry(30) is geometry
+    assert chart._get_horizontal_geometry(40) is not geometry
+    bar_heights = chart._get_bar_heights(10)
+    assert bar_heights == [5, 10]
+    assert chart._get_bar_heights(10) is bar_heights
+
+
+def test_build_bar_string_table():
+    assert _build_bar_string_table(4, 1) == ["", "█", "██", "███", "████"]
+    assert _build_bar_string_table(4, 3) == ["", "▏", "▎", "█", "█▏"]
+
+
+SCALE_VALUES = [index * 0.37 for index in range(1000)]
+SCALE_MAX = max(SCALE_VALUES)
+SCALE_EXPECTED = [int((value / SCALE_MAX) * 93) for value in SCALE_VALUES]
+
+
+@pytest.mark.parametrize(
+    "backend", ["python", "numpy-missing", "jit", "jit-import-failed"]
+)
+def test_scale_values(monkeypatch, backend):
+    monkeypatch.delenv("RICH_BAR_CHART_JIT", raising=False)
+    if backend == "python":
+        monkeypatch.setattr("rich.bar_chart._NUMPY_THRESHOLD", len(SCALE_VALUES) + 1)
+    elif backend == "numpy-missing":
+        monkeypatch.setattr("rich.bar_chart._load_numpy", lambda: None)
+    elif backend == "jit":
+        pytest.importorskip("numba")
+        monkeypatch.setenv("RICH_BAR_CHART_JIT", "1")
+    elif backend == "jit-import-failed":
+        monkeypatch.setenv("RICH_BAR_CHART_JIT", "1")
+        monkeypatch.setitem(sys.modules, "rich._bar_chart_fast", None)
+    _load_jit_scale_values.cache_clear()
+    try:
+        if backend == "jit":
+            assert _load_jit_scale_values() is not None
+        elif backend == "jit-import-failed":
+            assert _load_jit_scale_values() is None
+        assert _scale_values(SCALE_VALUES, SCALE_MAX, 93) == SCALE_EXPECTED
+    finally:
+        _load_jit_scale_values.cache_clear()
+
+
+def test_scale_values_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.delenv("RICH_BAR_CHART_JIT", raising=False)
+    loaded = []
+
+    def load_numpy_spy():
+        numpy = _load_numpy()
+        loaded.append(numpy)
+        return numpy
+
+    monkeypatch.setattr("rich.bar_chart._load_numpy", load_numpy_spy)
+    assert _scale_values(SCALE_VALUES, SCALE_MAX, 93) == SCALE_EXPECTED
+    assert len(loaded) == 1 and loaded[0] is not None
+
+
+def test_scale_values_zero_max():
+    assert _scale_values([1.0, 2.0], 0, 10) == [0, 0]
+
+
+def test_invalid_orientation():
+    with pytest.raises(ValueError):
+        BarChart([1, 2], orientation="diagonal")
+
+
+def test_mixed_tuple_data():
+    with pytest.raises(TypeError):
+        BarChart([("a", 1), 2])
+    with pytest.raises(TypeError):
+        BarChart([("a", 1), ("b", 2, 3)])
+
+
+def test_render_cached():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    console = Console(width=100)
+    options = console.options
+    segments = chart.__rich_console__(console, options)
+    assert chart.__rich_console__(console, options) is segments
+    assert chart.__rich_console__(console, options.update_width(20)) is not segments
+    chart.show_values = False
+    assert render(chart) == (
+        "  a \x1b[34m█████████████\x1b[0m\n bb \x1b[32m██████████████████████████\x1b[0m\n"
+    )
+
+
+def test_render_horizontal_grouped():
+    chart = BarChart({"a": {"x": 1, "y": 10}}, width=30)
+    expected = (
+        "a  x  \x1b[34m██\x1b[0m  1\n"
+        "   y  \x1b[32m█████████████████████\x1b[0m 10\n"
+        "\n"
+        "\x1b[34m█\x1b[0m x  \x1b[32m█\x1b[0m y  \n"
+    )
+    assert render(chart) == expected
+
+
+def test_vertical_rows_cached():
+    chart = BarChart([1, 2, 4], orientation="vertical")
+    rows = chart._get_vertical_rows(4, 1)
+    assert len(rows) == 4
+    assert chart._get_vertical_rows(4, 1) is rows
+    assert chart._get_vertical_rows(8, 1) is not rows
+
+
+def test_large_integer_values():
+    chart = BarChart([10**17 + 1, 2], width=60)
+    assert chart._value_texts == [" 100000000000000001", "                  2"]
+
+
+def test_change_orientation():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    render(chart)
+    chart.orientation = "vertical"
+    assert chart.orientation == "vertical"
+    assert render(chart) == render(
+        BarChart({"a": 1, "bb": 2}, width=30, orientation="vertical")
+    )
+    with pytest.raises(ValueError):
+        chart.orientation = "diagonal"
+    assert chart.orientation == "vertical"
+
+
+def test_replace_rows():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    render(chart)
+    chart.simple_rows = [("zzz", 2)]
+    assert render(chart) == render(BarChart({"zzz": 2}, width=30))
+
+    grouped = BarChart({"a": {"x": 1, "y": 10}}, width=30)
+    render(grouped)
+    grouped.group_rows = [("b", [5, 2]), ("c", [10, 3])]
+    expected = BarChart({"b": {"x": 5, "y": 2}, "c": {"x": 10, "y": 3}}, width=30)
+    assert render(grouped) == render(expected)
+
+
+def test_copy_chart():
+    chart = BarChart({"a": 1}, width=20)
+    render(chart)
+    chart_copy = copy.copy(chart)
+    chart_copy.simple_rows = [("NEW", 1)]
+    assert render(chart_copy) == render(BarChart({"NEW": 1}, width=20))
+    assert render(chart) == render(BarChart({"a": 1}, width=20))
+
+
+def test_render_cache_group_gap():
+    data = {"a": {"x": 1, "y": 2}, "b": {"x": 3, "y": 4}}
+    chart = BarChart(data, orientation="vertical", chart_height=4)
+    render(chart)
+    chart.group_gap = 4
+    expected = BarChart(data, orientation="vertical", chart_height=4, group_gap=4)
+    assert render(chart) == render(expected)
+
+
+def test_change_styles():
+    chart = BarChart({"a": 1, "bb": 2}, width=30)
+    render(chart)
+    chart.bar_styles = ["red"]
+    chart.label_style = "bold"
+    expected = BarChart(
+        {"a": 1, "bb": 2}, width=30, bar_styles=["red"], label_style="bold"
+    )
+    assert render(chart) == render(expected)
+
+
+def test_label_style_padding_unstyled():
+    chart = BarChart({"a": 1, "bb": 2}, width=30, label_style="on red")
+    lines = render(chart).splitlines()
+    assert lines[0].startswith("  \x1b[41ma\x1b[0m ")
+    assert lines[1].startswith(" \x1b[41mbb\x1b[0m ")
+
+    chart = BarChart(
+        {"a": 1, "bb": 2}, orientation="vertical", chart_height=2, label_style="on red"
+    )
+    assert render(chart).splitlines()[-1] == "\x1b[41ma\x1b[0m \x1b[41mb\x1b[0m"
+
+
+@pytest.mark.parametrize(
+    "flag,enabled",
+    [("", False), ("0", False), ("false", False), ("1", True), ("True", True)],
+)
+def test_jit_enabled(monkeypatch, flag, enabled):
+    monkeypatch.setenv("RICH_BAR_CHART_JIT", flag)
+    assert _jit_enabled() is enabled